@@ -11,15 +11,13 @@ from pathlib import Path
 
 # Import custom modules
 from src.data_loader import (
-    load_financial_data, load_budget_data, load_cash_flow_data,
-    merge_actual_budget, get_years, filter_by_period,
+    load_all,
+    merge_actual_budget, get_years, build_period_index, select_period,
     get_period_comparison, calculate_rolling_averages
 )
 from src.financial_analyzer import (
-    calculate_kpis, calculate_liquidity_ratios, calculate_efficiency_ratios,
-    calculate_leverage_ratios, calculate_profitability_ratios,
     calculate_annual_summary, calculate_quarterly_summary,
-    calculate_revenue_breakdown, get_health_indicators
+    calculate_revenue_breakdown, compute_executive_bundle
 )
 from src.forecasting import (
     forecast_revenue, forecast_metric, calculate_growth_projections,
@@ -27,11 +25,11 @@ from src.forecasting import (
 )
 from src.visualizations import (
     create_revenue_trend_chart, create_profitability_chart,
-    create_income_statement_waterfall, create_revenue_breakdown_pie,
+    create_income_statement_waterfall, create_revenue_breakdown_subplots,
     create_budget_variance_chart, create_cash_flow_chart,
     create_forecast_chart, create_financial_ratios_gauge,
     create_quarterly_comparison_chart, create_health_indicator_table,
-    create_scenario_chart
+    create_scenario_chart, WATERFALL_COLS
 )
 
 
@@ -44,36 +42,68 @@ st.set_page_config(
 )
 
 # Load custom CSS
-def load_css():
+@st.cache_data
+def _read_css() -> str:
     css_file = Path("assets/style.css")
     if css_file.exists():
         with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+            return f.read()
+    return ""
+
+def load_css():
+    css = _read_css()
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 load_css()
 
 
 # Cache data loading
 @st.cache_data
-def get_financial_data():
-    return load_financial_data()
+def get_all_data():
+    # cached: the three CSVs are read concurrently on the first miss only,
+    # and rolling averages are computed once per process, not per rerun
+    financial_df, budget_df, cash_flow_df = load_all()
+    return calculate_rolling_averages(financial_df), budget_df, cash_flow_df
+
+# Read-only period slices are shared as-is; cache_data would unpickle them every rerun
+@st.cache_resource
+def get_period_index():
+    return build_period_index(get_all_data()[0])
+
+@st.cache_resource
+def get_cash_flow_index():
+    return build_period_index(get_all_data()[2])
+
+
+# Cache analytics derived from the cached data
+@st.cache_data
+def get_annual_summary():
+    return calculate_annual_summary(get_all_data()[0])
+
+@st.cache_data
+def get_quarterly_summary():
+    return calculate_quarterly_summary(get_all_data()[0])
 
+# Period-level results are keyed on (year, quarter); the slice itself is not hashed
 @st.cache_data
-def get_budget_data():
-    return load_budget_data()
+def get_revenue_breakdown(_filtered_df, year, quarter):
+    return calculate_revenue_breakdown(_filtered_df)
 
 @st.cache_data
-def get_cash_flow():
-    return load_cash_flow_data()
+def get_executive_bundle(_filtered_df, year, quarter):
+    return compute_executive_bundle(_filtered_df)
+
+
+# (divisor, suffix, format prefix) for units, thousands and millions
+_CURRENCY_SCALES = ((1, '', ',.'), (1_000, 'K', '.'), (1_000_000, 'M', '.'))
 
 
 def format_currency(value: float, decimals: int = 0) -> str:
     """Format number as currency."""
-    if abs(value) >= 1_000_000:
-        return f"${value/1_000_000:.{decimals}f}M"
-    elif abs(value) >= 1_000:
-        return f"${value/1_000:.{decimals}f}K"
-    return f"${value:,.{decimals}f}"
+    magnitude = abs(float(value))
+    divisor, suffix, spec = _CURRENCY_SCALES[(magnitude >= 1_000) + (magnitude >= 1_000_000)]
+    return f"${value / divisor:{spec}{decimals}f}{suffix}"
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
@@ -84,12 +114,7 @@ def format_percentage(value: float, decimals: int = 1) -> str:
 # Main application
 def main():
     # Load data
-    df = get_financial_data()
-    budget_df = get_budget_data()
-    cash_flow_df = get_cash_flow()
-    
-    # Add rolling averages
-    df = calculate_rolling_averages(df)
+    df, budget_df, _ = get_all_data()
     
     # Header
     st.markdown("""
@@ -147,7 +172,9 @@ def main():
         """)
     
     # Filter data
-    filtered_df = filter_by_period(df, year=selected_year, quarter=selected_quarter)
+    filtered_df = select_period(get_period_index(), selected_year, selected_quarter)
+    # KPIs and every ratio group for the period, shared by all tabs
+    bundle = get_executive_bundle(filtered_df, selected_year, selected_quarter)
     
     # Main content tabs
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -163,7 +190,7 @@ def main():
     with tab1:
         st.header("Executive Summary")
         
-        kpis = calculate_kpis(filtered_df)
+        kpis = bundle['kpis']
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -217,12 +244,12 @@ def main():
         
         with col1:
             st.subheader("Revenue Trend")
-            revenue_chart = create_revenue_trend_chart(filtered_df)
+            revenue_chart = create_revenue_trend_chart(bundle['revenue_trend'])
             st.plotly_chart(revenue_chart, use_container_width=True)
         
         with col2:
             st.subheader("Profitability Margins")
-            profit_chart = create_profitability_chart(filtered_df)
+            profit_chart = create_profitability_chart(bundle['margin_trend'])
             st.plotly_chart(profit_chart, use_container_width=True)
         
         if compare_year:
@@ -255,32 +282,18 @@ def main():
                     )
         
         st.subheader("📋 Financial Health Indicators")
-        health_indicators = get_health_indicators(filtered_df)
-        health_table = create_health_indicator_table(health_indicators)
+        health_table = create_health_indicator_table(bundle['health_indicators'])
         st.plotly_chart(health_table, use_container_width=True)
     
     # Tab 2: Revenue Analysis
     with tab2:
         st.header("Revenue Analysis")
         
-        breakdown = calculate_revenue_breakdown(filtered_df)
+        breakdown = get_revenue_breakdown(filtered_df, selected_year, selected_quarter)
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.subheader("By Product")
-            pie_product = create_revenue_breakdown_pie(breakdown, 'by_product')
-            st.plotly_chart(pie_product, use_container_width=True)
-        
-        with col2:
-            st.subheader("By Region")
-            pie_region = create_revenue_breakdown_pie(breakdown, 'by_region')
-            st.plotly_chart(pie_region, use_container_width=True)
-        
-        with col3:
-            st.subheader("By Customer Segment")
-            pie_customer = create_revenue_breakdown_pie(breakdown, 'by_customer')
-            st.plotly_chart(pie_customer, use_container_width=True)
+        st.subheader("Revenue Breakdown")
+        breakdown_chart = create_revenue_breakdown_subplots(breakdown)
+        st.plotly_chart(breakdown_chart, use_container_width=True)
         
         st.divider()
         
@@ -292,9 +305,10 @@ def main():
         
         col1, col2, col3 = st.columns(3)
         
-        total_actual = merged_df['revenue'].sum()
-        total_budget = merged_df['budget_revenue'].sum()
-        total_variance = total_actual - total_budget
+        totals = merged_df[['revenue', 'budget_revenue', 'revenue_variance']].sum()
+        total_actual = totals['revenue']
+        total_budget = totals['budget_revenue']
+        total_variance = totals['revenue_variance']
         variance_pct = (total_variance / total_budget) * 100
         
         with col1:
@@ -305,7 +319,7 @@ def main():
             st.metric("Variance", format_currency(total_variance), delta=format_percentage(variance_pct))
         
         st.subheader("📈 Quarterly Performance")
-        quarterly_df = calculate_quarterly_summary(df)
+        quarterly_df = get_quarterly_summary()
         quarterly_chart = create_quarterly_comparison_chart(quarterly_df)
         st.plotly_chart(quarterly_chart, use_container_width=True)
     
@@ -314,7 +328,7 @@ def main():
         st.header("Profitability Analysis")
         
         st.subheader("📊 Income Statement Breakdown")
-        latest_row = filtered_df.iloc[-1]
+        latest_row = {c: filtered_df[c].iat[-1] for c in WATERFALL_COLS}
         waterfall = create_income_statement_waterfall(latest_row)
         st.plotly_chart(waterfall, use_container_width=True)
         
@@ -322,7 +336,7 @@ def main():
         
         st.subheader("📈 Profitability Ratios")
         
-        prof_ratios = calculate_profitability_ratios(filtered_df)
+        prof_ratios = bundle['profitability']
         
         col1, col2, col3 = st.columns(3)
         
@@ -349,7 +363,7 @@ def main():
         st.plotly_chart(margin_chart, use_container_width=True)
         
         st.subheader("📋 Annual Summary")
-        annual_df = calculate_annual_summary(df)
+        annual_df = get_annual_summary()
         
         display_cols = ['year', 'revenue', 'gross_profit', 'net_income', 
                        'gross_margin', 'net_margin', 'revenue_growth']
@@ -374,9 +388,7 @@ def main():
     with tab4:
         st.header("Cash Flow Analysis")
         
-        cf_filtered = cash_flow_df[cash_flow_df['date'].dt.year == selected_year]
-        if selected_quarter:
-            cf_filtered = cf_filtered[cf_filtered['date'].dt.quarter == selected_quarter]
+        cf_filtered = select_period(get_cash_flow_index(), selected_year, selected_quarter)
         
         st.subheader("📊 Cash Flow Components")
         cf_chart = create_cash_flow_chart(cf_filtered)
@@ -388,21 +400,21 @@ def main():
         
         col1, col2, col3, col4 = st.columns(4)
         
+        operating_cf, investing_cf, financing_cf, net_cf = cf_filtered[
+            ['operating_cash_flow', 'investing_cash_flow', 'financing_cash_flow', 'net_cash_flow']
+        ].to_numpy().sum(axis=0)
+        
         with col1:
-            operating_cf = cf_filtered['operating_cash_flow'].sum()
             st.metric("Operating Cash Flow", format_currency(operating_cf),
                      delta="Positive" if operating_cf > 0 else "Negative")
         
         with col2:
-            investing_cf = cf_filtered['investing_cash_flow'].sum()
             st.metric("Investing Cash Flow", format_currency(investing_cf))
         
         with col3:
-            financing_cf = cf_filtered['financing_cash_flow'].sum()
             st.metric("Financing Cash Flow", format_currency(financing_cf))
         
         with col4:
-            net_cf = cf_filtered['net_cash_flow'].sum()
             st.metric("Net Cash Flow", format_currency(net_cf),
                      delta="Positive" if net_cf > 0 else "Negative")
         
@@ -432,7 +444,7 @@ def main():
         st.header("Financial Ratios")
         
         st.subheader("💧 Liquidity Ratios")
-        liquidity = calculate_liquidity_ratios(filtered_df)
+        liquidity = bundle['liquidity']
         
         col1, col2, col3 = st.columns(3)
         
@@ -460,7 +472,7 @@ def main():
         st.divider()
         
         st.subheader("⚡ Efficiency Ratios")
-        efficiency = calculate_efficiency_ratios(filtered_df)
+        efficiency = bundle['efficiency']
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -485,7 +497,7 @@ def main():
         st.divider()
         
         st.subheader("📊 Leverage Ratios")
-        leverage = calculate_leverage_ratios(filtered_df)
+        leverage = bundle['leverage']
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -0,0 +1,16 @@
+"""
+Compatibility Module
+Shims for optional dependencies used by the computation kernels.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; kernels then run as plain Python
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
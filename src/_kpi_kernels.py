@@ -0,0 +1,86 @@
+"""
+KPI Kernels Module
+Compiled arithmetic for the financial ratio calculations.
+"""
+
+import numpy as np
+
+from src._compat import njit
+
+
+# Packed input layout: compute_ratios reads these columns by position
+RATIO_INPUTS = (
+    'current_assets', 'current_liabilities', 'inventory', 'cash',
+    'revenue', 'cogs', 'total_assets', 'accounts_receivable', 'accounts_payable',
+    'total_liabilities', 'total_equity', 'operating_income', 'interest_expense',
+    'long_term_debt', 'net_income', 'gross_margin', 'operating_margin', 'net_margin'
+)
+
+# Packed output layout, grouped as returned by the calculate_*_ratios functions
+RATIO_OUTPUTS = (
+    ('liquidity', ('current_ratio', 'quick_ratio', 'cash_ratio')),
+    ('efficiency', (
+        'asset_turnover', 'inventory_turnover', 'receivables_turnover',
+        'dso', 'dio', 'dpo', 'cash_conversion_cycle'
+    )),
+    ('leverage', ('debt_to_equity', 'debt_ratio', 'interest_coverage', 'lt_debt_to_equity')),
+    ('profitability', ('roa', 'roe', 'roic', 'gross_margin', 'operating_margin', 'net_margin'))
+)
+
+
+@njit(cache=True, error_model='numpy')
+def compute_ratios(v):
+    """Compute every ratio from a packed RATIO_INPUTS vector, in RATIO_OUTPUTS order."""
+    current_assets = v[0]
+    current_liabilities = v[1]
+    inventory = v[2]
+    cash = v[3]
+    revenue = v[4]
+    cogs = v[5]
+    total_assets = v[6]
+    accounts_receivable = v[7]
+    accounts_payable = v[8]
+    total_liabilities = v[9]
+    total_equity = v[10]
+    operating_income = v[11]
+    interest_expense = v[12]
+    long_term_debt = v[13]
+    net_income = v[14]
+
+    out = np.empty(20, dtype=np.float64)
+
+    # Liquidity
+    out[0] = current_assets / current_liabilities
+    out[1] = (current_assets - inventory) / current_liabilities
+    out[2] = cash / current_liabilities
+
+    # Efficiency (turnovers annualized from monthly figures)
+    inventory_turnover = (cogs * 12) / inventory
+    receivables_turnover = (revenue * 12) / accounts_receivable
+    payables_turnover = (cogs * 12) / accounts_payable
+    dso = 365 / receivables_turnover
+    dio = 365 / inventory_turnover
+    dpo = 365 / payables_turnover
+    out[3] = (revenue * 12) / total_assets
+    out[4] = inventory_turnover
+    out[5] = receivables_turnover
+    out[6] = dso
+    out[7] = dio
+    out[8] = dpo
+    out[9] = dso + dio - dpo
+
+    # Leverage
+    out[10] = total_liabilities / total_equity
+    out[11] = total_liabilities / total_assets
+    out[12] = operating_income / interest_expense if interest_expense > 0 else 0.0
+    out[13] = long_term_debt / total_equity
+
+    # Profitability (returns annualized, in percent)
+    out[14] = (net_income * 12) / total_assets * 100
+    out[15] = (net_income * 12) / total_equity * 100
+    out[16] = (operating_income * 12) / (total_equity + long_term_debt) * 100
+    out[17] = v[15]
+    out[18] = v[16]
+    out[19] = v[17]
+
+    return out
@@ -6,61 +6,123 @@ Handles loading, cleaning, and preprocessing of financial data.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from src._compat import njit, HAS_NUMBA
+
+
+# Column schemas for the source CSVs (everything except 'date' is numeric).
+# Values load as float64 so sums and ratios keep full precision; charts
+# narrow their own trace arrays to float32.
+FINANCIAL_COLUMNS = [
+    'revenue', 'cogs', 'gross_profit', 'operating_expenses', 'operating_income',
+    'interest_expense', 'tax_expense', 'net_income', 'total_assets', 'total_liabilities',
+    'total_equity', 'current_assets', 'current_liabilities', 'inventory',
+    'accounts_receivable', 'accounts_payable', 'cash', 'long_term_debt', 'depreciation',
+    'capex', 'product_software', 'product_services', 'product_hardware',
+    'region_north_america', 'region_europe', 'region_asia', 'region_other',
+    'customers_enterprise', 'customers_smb', 'customers_consumer'
+]
+
+BUDGET_COLUMNS = [
+    'budget_revenue', 'budget_cogs', 'budget_gross_profit', 'budget_operating_expenses',
+    'budget_operating_income', 'budget_net_income'
+]
+
+CASH_FLOW_COLUMNS = [
+    'operating_cash_flow', 'investing_cash_flow', 'financing_cash_flow', 'net_cash_flow',
+    'beginning_cash', 'ending_cash'
+]
+
+
+def _read_dated_csv(file_path: str, columns: list) -> pd.DataFrame:
+    """Read a CSV with the Arrow parser, parsing dates and skipping type inference."""
+    df = pd.read_csv(
+        file_path,
+        engine='pyarrow',
+        parse_dates=['date'],
+        dtype=dict.fromkeys(columns, 'float64')
+    )
+    return df.sort_values('date', ignore_index=True)
 
 
 def load_financial_data(file_path: str = "data/financial_data.csv") -> pd.DataFrame:
     """Load and preprocess financial data."""
-    df = pd.read_csv(file_path)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
+    df = _read_dated_csv(file_path, FINANCIAL_COLUMNS)
     
     # Add calculated columns
-    df['year'] = df['date'].dt.year
-    df['month'] = df['date'].dt.month
-    df['quarter'] = df['date'].dt.quarter
-    df['month_name'] = df['date'].dt.strftime('%b %Y')
-    
-    # Calculate margins
-    df['gross_margin'] = (df['gross_profit'] / df['revenue'] * 100).round(2)
-    df['operating_margin'] = (df['operating_income'] / df['revenue'] * 100).round(2)
-    df['net_margin'] = (df['net_income'] / df['revenue'] * 100).round(2)
+    df['year'] = df['date'].dt.year.astype('int16')
+    df['month'] = df['date'].dt.month.astype('uint8')
+    df['quarter'] = df['date'].dt.quarter.astype('uint8')
     
+    # Calculate margins on the raw arrays, sharing one reciprocal of revenue
+    rev, gp, oi, ni, dep = (
+        df[c].to_numpy()
+        for c in ['revenue', 'gross_profit', 'operating_income', 'net_income', 'depreciation']
+    )
+    inv = np.reciprocal(rev) * 100.0
+    df['gross_margin'] = gp * inv
+    df['operating_margin'] = oi * inv
+    df['net_margin'] = ni * inv
+
     # Calculate EBITDA
-    df['ebitda'] = df['operating_income'] + df['depreciation']
-    df['ebitda_margin'] = (df['ebitda'] / df['revenue'] * 100).round(2)
-    
+    ebitda = oi + dep
+    df['ebitda'] = ebitda
+    df['ebitda_margin'] = ebitda * inv
+
     return df
 
 
 def load_budget_data(file_path: str = "data/budget_data.csv") -> pd.DataFrame:
     """Load budget data."""
-    df = pd.read_csv(file_path)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
-    return df
+    return _read_dated_csv(file_path, BUDGET_COLUMNS)
 
 
 def load_cash_flow_data(file_path: str = "data/cash_flow_data.csv") -> pd.DataFrame:
     """Load cash flow data."""
-    df = pd.read_csv(file_path)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
-    return df
+    return _read_dated_csv(file_path, CASH_FLOW_COLUMNS)
+
+
+def load_all(
+    financial_path: str = "data/financial_data.csv",
+    budget_path: str = "data/budget_data.csv",
+    cash_flow_path: str = "data/cash_flow_data.csv"
+) -> tuple:
+    """Load financial, budget and cash flow data concurrently."""
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        financial = pool.submit(load_financial_data, financial_path)
+        budget = pool.submit(load_budget_data, budget_path)
+        cash_flow = pool.submit(load_cash_flow_data, cash_flow_path)
+        return financial.result(), budget.result(), cash_flow.result()
 
 
 def merge_actual_budget(actual_df: pd.DataFrame, budget_df: pd.DataFrame) -> pd.DataFrame:
-    """Merge actual and budget data for variance analysis."""
-    merged = actual_df.merge(budget_df, on='date', suffixes=('_actual', '_budget'))
+    """
+    Merge actual and budget data for variance analysis.
     
-    # Calculate variances
-    merged['revenue_variance'] = merged['revenue'] - merged['budget_revenue']
-    merged['revenue_variance_pct'] = (merged['revenue_variance'] / merged['budget_revenue'] * 100).round(2)
+    Both frames must be sorted by date (the loaders guarantee this), so
+    months are aligned with a binary search instead of a hash join.
+    """
+    actual_dates = actual_df['date'].to_numpy()
+    budget_dates = budget_df['date'].to_numpy()
+    pos = np.searchsorted(budget_dates, actual_dates)
+    hit = pos < len(budget_dates)
+    hit[hit] = budget_dates[pos[hit]] == actual_dates[hit]
     
-    merged['net_income_variance'] = merged['net_income'] - merged['budget_net_income']
-    merged['net_income_variance_pct'] = (merged['net_income_variance'] / merged['budget_net_income'] * 100).round(2)
+    merged = pd.concat([
+        actual_df[hit].reset_index(drop=True),
+        budget_df.iloc[pos[hit]].drop(columns='date').reset_index(drop=True)
+    ], axis=1)
+    
+    # Calculate variances
+    actual = merged[['revenue', 'net_income', 'operating_expenses']].to_numpy(dtype=np.float64)
+    budget = merged[['budget_revenue', 'budget_net_income', 'budget_operating_expenses']].to_numpy(dtype=np.float64)
+    variance = actual - budget
+    variance_pct = variance / budget * 100
     
-    merged['opex_variance'] = merged['operating_expenses'] - merged['budget_operating_expenses']
-    merged['opex_variance_pct'] = (merged['opex_variance'] / merged['budget_operating_expenses'] * 100).round(2)
+    for i, name in enumerate(['revenue', 'net_income', 'opex']):
+        merged[f'{name}_variance'] = variance[:, i]
+        merged[f'{name}_variance_pct'] = variance_pct[:, i]
     
     return merged
 
@@ -77,12 +139,30 @@ def get_quarters(df: pd.DataFrame) -> list:
 
 def filter_by_period(df: pd.DataFrame, year: int = None, quarter: int = None) -> pd.DataFrame:
     """Filter data by year and/or quarter."""
-    filtered = df.copy()
+    mask = np.ones(len(df), dtype=bool)
     if year:
-        filtered = filtered[filtered['year'] == year]
+        mask &= df['year'].to_numpy() == year
     if quarter:
-        filtered = filtered[filtered['quarter'] == quarter]
-    return filtered
+        mask &= df['quarter'].to_numpy() == quarter
+    return df[mask]
+
+
+def build_period_index(df: pd.DataFrame) -> dict:
+    """Pre-split data into per-year and per-quarter slices keyed by date."""
+    year = df['date'].dt.year
+    quarter = df['date'].dt.quarter
+    return {
+        'by_year': {int(y): sub for y, sub in df.groupby(year)},
+        'by_yq': {(int(y), int(q)): sub for (y, q), sub in df.groupby([year, quarter])},
+        'empty': df.iloc[:0]
+    }
+
+
+def select_period(period_index: dict, year: int, quarter: int = None) -> pd.DataFrame:
+    """Look up a slice built by build_period_index."""
+    if quarter:
+        return period_index['by_yq'].get((year, quarter), period_index['empty'])
+    return period_index['by_year'].get(year, period_index['empty'])
 
 
 def get_ytd_data(df: pd.DataFrame, year: int) -> pd.DataFrame:
@@ -98,22 +178,78 @@ def get_period_comparison(df: pd.DataFrame, current_year: int, previous_year: in
     if current.empty or previous.empty:
         return {}
     
+    cols = ['revenue', 'net_income', 'gross_profit']
+    cur = current[cols].sum()
+    prev = previous[cols].sum()
+    
     return {
-        'current_revenue': current['revenue'].sum(),
-        'previous_revenue': previous['revenue'].sum(),
-        'revenue_growth': ((current['revenue'].sum() / previous['revenue'].sum()) - 1) * 100,
-        'current_net_income': current['net_income'].sum(),
-        'previous_net_income': previous['net_income'].sum(),
-        'net_income_growth': ((current['net_income'].sum() / previous['net_income'].sum()) - 1) * 100,
-        'current_gross_margin': (current['gross_profit'].sum() / current['revenue'].sum()) * 100,
-        'previous_gross_margin': (previous['gross_profit'].sum() / previous['revenue'].sum()) * 100,
+        'current_revenue': cur['revenue'],
+        'previous_revenue': prev['revenue'],
+        'revenue_growth': ((cur['revenue'] / prev['revenue']) - 1) * 100,
+        'current_net_income': cur['net_income'],
+        'previous_net_income': prev['net_income'],
+        'net_income_growth': ((cur['net_income'] / prev['net_income']) - 1) * 100,
+        'current_gross_margin': (cur['gross_profit'] / cur['revenue']) * 100,
+        'previous_gross_margin': (prev['gross_profit'] / prev['revenue']) * 100,
     }
 
 
+@njit(cache=True)
+def _rolling3_means(rev, ni, gm, w, out_rev, out_ni, out_gm):
+    """Fill trailing window means for three series in a single pass.
+    
+    Like pandas rolling(w).mean(), a window holding any NaN yields NaN, and
+    values resume once the NaN has left the window.
+    """
+    s_rev = 0.0
+    s_ni = 0.0
+    s_gm = 0.0
+    # Non-NaN values currently in each window
+    c_rev = 0
+    c_ni = 0
+    c_gm = 0
+    for i in range(rev.shape[0]):
+        if not np.isnan(rev[i]):
+            s_rev += rev[i]
+            c_rev += 1
+        if not np.isnan(ni[i]):
+            s_ni += ni[i]
+            c_ni += 1
+        if not np.isnan(gm[i]):
+            s_gm += gm[i]
+            c_gm += 1
+        if i >= w:
+            if not np.isnan(rev[i - w]):
+                s_rev -= rev[i - w]
+                c_rev -= 1
+            if not np.isnan(ni[i - w]):
+                s_ni -= ni[i - w]
+                c_ni -= 1
+            if not np.isnan(gm[i - w]):
+                s_gm -= gm[i - w]
+                c_gm -= 1
+        out_rev[i] = s_rev / w if c_rev == w else np.nan
+        out_ni[i] = s_ni / w if c_ni == w else np.nan
+        out_gm[i] = s_gm / w if c_gm == w else np.nan
+
+
 def calculate_rolling_averages(df: pd.DataFrame, window: int = 3) -> pd.DataFrame:
     """Calculate rolling averages for key metrics."""
     df = df.copy()
-    df['revenue_ma'] = df['revenue'].rolling(window=window).mean()
-    df['net_income_ma'] = df['net_income'].rolling(window=window).mean()
-    df['gross_margin_ma'] = df['gross_margin'].rolling(window=window).mean()
+    if HAS_NUMBA:
+        n = len(df)
+        out_rev, out_ni, out_gm = np.empty(n), np.empty(n), np.empty(n)
+        _rolling3_means(
+            df['revenue'].to_numpy(dtype=np.float64),
+            df['net_income'].to_numpy(dtype=np.float64),
+            df['gross_margin'].to_numpy(dtype=np.float64),
+            window, out_rev, out_ni, out_gm
+        )
+        df['revenue_ma'] = out_rev
+        df['net_income_ma'] = out_ni
+        df['gross_margin_ma'] = out_gm
+    else:
+        df['revenue_ma'] = df['revenue'].rolling(window=window).mean()
+        df['net_income_ma'] = df['net_income'].rolling(window=window).mean()
+        df['gross_margin_ma'] = df['gross_margin'].rolling(window=window).mean()
     return df
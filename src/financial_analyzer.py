@@ -6,24 +6,99 @@ Contains functions for calculating financial KPIs and ratios.
 import pandas as pd
 import numpy as np
 
+from src._kpi_kernels import RATIO_INPUTS, RATIO_OUTPUTS, compute_ratios
 
-def calculate_kpis(df: pd.DataFrame) -> dict:
+
+# Last-row columns read by each calculation
+_KPI_COLS = (
+    'revenue', 'gross_profit', 'gross_margin', 'operating_income', 'operating_margin',
+    'net_income', 'net_margin', 'ebitda', 'ebitda_margin',
+    'total_assets', 'total_liabilities', 'total_equity', 'cash'
+)
+_ALL_COLS = tuple(dict.fromkeys(_KPI_COLS + RATIO_INPUTS))
+
+# Revenue breakdown: (output key, ((label, column), ...)) per segment family
+_BREAKDOWN_SEGMENTS = (
+    ('by_product', (
+        ('Software', 'product_software'), ('Services', 'product_services'),
+        ('Hardware', 'product_hardware')
+    )),
+    ('by_region', (
+        ('North America', 'region_north_america'), ('Europe', 'region_europe'),
+        ('Asia', 'region_asia'), ('Other', 'region_other')
+    )),
+    ('by_customer', (
+        ('Enterprise', 'customers_enterprise'), ('SMB', 'customers_smb'),
+        ('Consumer', 'customers_consumer')
+    ))
+)
+_BREAKDOWN_COLS = ['revenue'] + [col for _, pairs in _BREAKDOWN_SEGMENTS for _, col in pairs]
+
+# Decimal places for each compute_ratios output (days-based efficiency figures use one)
+_DAY_RATIOS = frozenset(('dso', 'dio', 'dpo', 'cash_conversion_cycle'))
+_RATIO_DECIMALS = np.array([
+    1 if label in _DAY_RATIOS else 2 for _, labels in RATIO_OUTPUTS for label in labels
+])
+_RATIO_SCALE = 10.0 ** _RATIO_DECIMALS
+
+# Health indicators: (metric, ratio group, ratio key, benchmark, description, value suffix)
+_HEALTH_INDICATORS = (
+    ('Current Ratio', 'liquidity', 'current_ratio', '≥ 1.5', 'Ability to pay short-term obligations', ''),
+    ('Quick Ratio', 'liquidity', 'quick_ratio', '≥ 1.0', 'Liquid assets coverage of current liabilities', ''),
+    ('Debt to Equity', 'leverage', 'debt_to_equity', '≤ 1.0', 'Financial leverage level', ''),
+    ('Interest Coverage', 'leverage', 'interest_coverage', '≥ 3.0', 'Ability to service debt', ''),
+    ('Return on Equity', 'profitability', 'roe', '≥ 15%', 'Shareholder return efficiency', '%'),
+    ('Net Profit Margin', 'profitability', 'net_margin', '≥ 15%', 'Bottom line profitability', '%')
+)
+# (good, warning) thresholds per indicator; a -1 sign marks lower-is-better metrics
+_HEALTH_THRESHOLDS = np.array([[1.5, 1.0], [1.0, 0.7], [1.0, 2.0], [3.0, 1.5], [15, 10], [15, 10]])
+_HEALTH_SIGN = np.array([1, 1, -1, 1, 1, 1])
+_HEALTH_LABELS = np.array(['Good', 'Warning', 'Critical'])
+
+
+def _last_row_dict(df: pd.DataFrame, cols, pos: int = -1) -> dict:
+    """Read one row of the given columns straight from their arrays as Python scalars."""
+    return {c: df[c].to_numpy()[pos].item() for c in cols}
+
+
+def _aggregate_by(df: pd.DataFrame, keys: list, sums: list, lasts: list = ()) -> pd.DataFrame:
     """
-    Calculate key performance indicators from financial data.
+    Group rows by integer key columns, summing `sums` and taking the last value of `lasts`.
     
-    Args:
-        df: DataFrame with financial data
-        
-    Returns:
-        Dictionary with KPI values
+    Missing values are skipped in both, as with pandas groupby 'sum' and 'last'.
     """
-    latest = df.iloc[-1]
-    
-    # Get previous period for comparison
-    if len(df) > 1:
-        previous = df.iloc[-2]
-        revenue_change = ((latest['revenue'] / previous['revenue']) - 1) * 100
-        net_income_change = ((latest['net_income'] / previous['net_income']) - 1) * 100
+    uniques, codes = np.unique(
+        np.column_stack([df[k].to_numpy() for k in keys]), axis=0, return_inverse=True
+    )
+    codes = codes.ravel()
+    n_groups = len(uniques)
+    
+    out = {k: uniques[:, i].astype(df[k].dtype) for i, k in enumerate(keys)}
+    for c in sums:
+        values = df[c].to_numpy(dtype=np.float64)
+        present = ~np.isnan(values)
+        out[c] = np.bincount(codes[present], weights=values[present], minlength=n_groups)
+    for c in lasts:
+        # Like pandas 'last': skip missing values, NaN only for all-missing groups
+        values = df[c].to_numpy()
+        present = np.flatnonzero(~pd.isna(values))
+        last_row = np.full(n_groups, -1)
+        np.maximum.at(last_row, codes[present], present)
+        if (last_row < 0).any():
+            dtype = values.dtype if values.dtype.kind == 'f' else np.float64
+            out[c] = np.where(last_row >= 0, values[last_row], np.nan).astype(dtype)
+        else:
+            out[c] = values[last_row]
+    return pd.DataFrame(out)
+
+
+def _kpis(latest: dict, previous: dict = None) -> dict:
+    """KPI values from last-row (and previous-row) column values."""
+    # Compare against the previous period when there is one (np.divide keeps a
+    # zero previous value at inf rather than raising on Python floats)
+    if previous is not None:
+        revenue_change = (np.divide(latest['revenue'], previous['revenue']) - 1) * 100
+        net_income_change = (np.divide(latest['net_income'], previous['net_income']) - 1) * 100
     else:
         revenue_change = 0
         net_income_change = 0
@@ -52,6 +127,33 @@ def calculate_kpis(df: pd.DataFrame) -> dict:
     }
 
 
+def calculate_kpis(df: pd.DataFrame) -> dict:
+    """
+    Calculate key performance indicators from financial data.
+    
+    Args:
+        df: DataFrame with financial data
+        
+    Returns:
+        Dictionary with KPI values
+    """
+    latest = _last_row_dict(df, _KPI_COLS)
+    previous = _last_row_dict(df, ('revenue', 'net_income'), pos=-2) if len(df) > 1 else None
+    return _kpis(latest, previous)
+
+
+def _ratio_groups(latest: dict) -> dict:
+    """Run the ratio kernel on last-row column values and split its output into groups."""
+    out = compute_ratios(np.array([latest[c] for c in RATIO_INPUTS], dtype=np.float64))
+    rounded = (np.rint(out * _RATIO_SCALE) / _RATIO_SCALE).tolist()
+    
+    groups, start = {}, 0
+    for group, labels in RATIO_OUTPUTS:
+        groups[group] = dict(zip(labels, rounded[start:start + len(labels)]))
+        start += len(labels)
+    return groups
+
+
 def calculate_liquidity_ratios(df: pd.DataFrame) -> dict:
     """
     Calculate liquidity ratios.
@@ -62,21 +164,7 @@ def calculate_liquidity_ratios(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with liquidity ratios
     """
-    latest = df.iloc[-1]
-    
-    current_ratio = latest['current_assets'] / latest['current_liabilities']
-    
-    # Quick ratio = (Current Assets - Inventory) / Current Liabilities
-    quick_ratio = (latest['current_assets'] - latest['inventory']) / latest['current_liabilities']
-    
-    # Cash ratio = Cash / Current Liabilities
-    cash_ratio = latest['cash'] / latest['current_liabilities']
-    
-    return {
-        'current_ratio': round(current_ratio, 2),
-        'quick_ratio': round(quick_ratio, 2),
-        'cash_ratio': round(cash_ratio, 2)
-    }
+    return _ratio_groups(_last_row_dict(df, RATIO_INPUTS))['liquidity']
 
 
 def calculate_efficiency_ratios(df: pd.DataFrame) -> dict:
@@ -89,39 +177,7 @@ def calculate_efficiency_ratios(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with efficiency ratios
     """
-    latest = df.iloc[-1]
-    
-    # Asset Turnover = Revenue / Total Assets (annualized)
-    asset_turnover = (latest['revenue'] * 12) / latest['total_assets']
-    
-    # Inventory Turnover = COGS / Inventory (annualized)
-    inventory_turnover = (latest['cogs'] * 12) / latest['inventory']
-    
-    # Receivables Turnover = Revenue / Accounts Receivable (annualized)
-    receivables_turnover = (latest['revenue'] * 12) / latest['accounts_receivable']
-    
-    # Days Sales Outstanding = 365 / Receivables Turnover
-    dso = 365 / receivables_turnover
-    
-    # Days Inventory Outstanding = 365 / Inventory Turnover
-    dio = 365 / inventory_turnover
-    
-    # Days Payable Outstanding
-    payables_turnover = (latest['cogs'] * 12) / latest['accounts_payable']
-    dpo = 365 / payables_turnover
-    
-    # Cash Conversion Cycle = DSO + DIO - DPO
-    ccc = dso + dio - dpo
-    
-    return {
-        'asset_turnover': round(asset_turnover, 2),
-        'inventory_turnover': round(inventory_turnover, 2),
-        'receivables_turnover': round(receivables_turnover, 2),
-        'dso': round(dso, 1),
-        'dio': round(dio, 1),
-        'dpo': round(dpo, 1),
-        'cash_conversion_cycle': round(ccc, 1)
-    }
+    return _ratio_groups(_last_row_dict(df, RATIO_INPUTS))['efficiency']
 
 
 def calculate_leverage_ratios(df: pd.DataFrame) -> dict:
@@ -134,26 +190,7 @@ def calculate_leverage_ratios(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with leverage ratios
     """
-    latest = df.iloc[-1]
-    
-    # Debt to Equity = Total Liabilities / Total Equity
-    debt_to_equity = latest['total_liabilities'] / latest['total_equity']
-    
-    # Debt Ratio = Total Liabilities / Total Assets
-    debt_ratio = latest['total_liabilities'] / latest['total_assets']
-    
-    # Interest Coverage = Operating Income / Interest Expense
-    interest_coverage = latest['operating_income'] / latest['interest_expense'] if latest['interest_expense'] > 0 else 0
-    
-    # Long-term Debt to Equity
-    lt_debt_to_equity = latest['long_term_debt'] / latest['total_equity']
-    
-    return {
-        'debt_to_equity': round(debt_to_equity, 2),
-        'debt_ratio': round(debt_ratio, 2),
-        'interest_coverage': round(interest_coverage, 2),
-        'lt_debt_to_equity': round(lt_debt_to_equity, 2)
-    }
+    return _ratio_groups(_last_row_dict(df, RATIO_INPUTS))['leverage']
 
 
 def calculate_profitability_ratios(df: pd.DataFrame) -> dict:
@@ -166,26 +203,25 @@ def calculate_profitability_ratios(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with profitability ratios
     """
-    latest = df.iloc[-1]
-    
-    # Return on Assets = Net Income / Total Assets (annualized)
-    roa = (latest['net_income'] * 12) / latest['total_assets'] * 100
-    
-    # Return on Equity = Net Income / Total Equity (annualized)
-    roe = (latest['net_income'] * 12) / latest['total_equity'] * 100
+    return _ratio_groups(_last_row_dict(df, RATIO_INPUTS))['profitability']
+
+
+def compute_all_ratios(df: pd.DataFrame) -> dict:
+    """
+    Calculate KPIs and every ratio group from a single read of the last rows.
     
-    # Return on Invested Capital
-    invested_capital = latest['total_equity'] + latest['long_term_debt']
-    roic = (latest['operating_income'] * 12) / invested_capital * 100
+    Args:
+        df: DataFrame with financial data
+        
+    Returns:
+        Dictionary with 'kpis', 'liquidity', 'efficiency', 'leverage' and
+        'profitability' dicts, matching the individual calculate_* functions
+    """
+    rows = df.iloc[-2:][list(_ALL_COLS)].to_numpy(dtype=np.float64).tolist()
+    latest = dict(zip(_ALL_COLS, rows[-1]))
+    previous = dict(zip(_ALL_COLS, rows[0])) if len(rows) > 1 else None
     
-    return {
-        'roa': round(roa, 2),
-        'roe': round(roe, 2),
-        'roic': round(roic, 2),
-        'gross_margin': latest['gross_margin'],
-        'operating_margin': latest['operating_margin'],
-        'net_margin': latest['net_margin']
-    }
+    return {'kpis': _kpis(latest, previous), **_ratio_groups(latest)}
 
 
 def calculate_annual_summary(df: pd.DataFrame) -> pd.DataFrame:
@@ -198,27 +234,30 @@ def calculate_annual_summary(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with annual summaries
     """
-    annual = df.groupby('year').agg({
-        'revenue': 'sum',
-        'gross_profit': 'sum',
-        'operating_income': 'sum',
-        'net_income': 'sum',
-        'ebitda': 'sum',
-        'total_assets': 'last',
-        'total_equity': 'last',
-        'cash': 'last'
-    }).reset_index()
-    
-    # Calculate margins
-    annual['gross_margin'] = (annual['gross_profit'] / annual['revenue'] * 100).round(2)
-    annual['operating_margin'] = (annual['operating_income'] / annual['revenue'] * 100).round(2)
-    annual['net_margin'] = (annual['net_income'] / annual['revenue'] * 100).round(2)
-    
-    # Calculate YoY growth
-    annual['revenue_growth'] = annual['revenue'].pct_change() * 100
-    annual['net_income_growth'] = annual['net_income'].pct_change() * 100
-    
-    return annual
+    annual = _aggregate_by(
+        df, ['year'],
+        sums=['revenue', 'gross_profit', 'operating_income', 'net_income', 'ebitda'],
+        lasts=['total_assets', 'total_equity', 'cash']
+    )
+    
+    rev, gp, oi, ni = (
+        annual[c].to_numpy() for c in ['revenue', 'gross_profit', 'operating_income', 'net_income']
+    )
+    
+    # Calculate YoY growth (first year has no prior period)
+    revenue_growth = np.full(len(annual), np.nan)
+    revenue_growth[1:] = np.diff(rev) / rev[:-1] * 100
+    net_income_growth = np.full(len(annual), np.nan)
+    net_income_growth[1:] = np.diff(ni) / ni[:-1] * 100
+    
+    # Attach margins and growth in a single assign
+    return annual.assign(
+        gross_margin=np.round(gp / rev * 100, 2),
+        operating_margin=np.round(oi / rev * 100, 2),
+        net_margin=np.round(ni / rev * 100, 2),
+        revenue_growth=revenue_growth,
+        net_income_growth=net_income_growth
+    )
 
 
 def calculate_quarterly_summary(df: pd.DataFrame) -> pd.DataFrame:
@@ -231,13 +270,10 @@ def calculate_quarterly_summary(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with quarterly summaries
     """
-    quarterly = df.groupby(['year', 'quarter']).agg({
-        'revenue': 'sum',
-        'gross_profit': 'sum',
-        'operating_income': 'sum',
-        'net_income': 'sum',
-        'ebitda': 'sum'
-    }).reset_index()
+    quarterly = _aggregate_by(
+        df, ['year', 'quarter'],
+        sums=['revenue', 'gross_profit', 'operating_income', 'net_income', 'ebitda']
+    )
     
     quarterly['period'] = quarterly['year'].astype(str) + ' Q' + quarterly['quarter'].astype(str)
     
@@ -258,112 +294,97 @@ def calculate_revenue_breakdown(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with revenue breakdowns
     """
-    latest = df.iloc[-1]
-    total_revenue = latest['revenue']
-    
-    # Product breakdown
-    product_breakdown = {
-        'Software': {'value': latest['product_software'], 'pct': latest['product_software'] / total_revenue * 100},
-        'Services': {'value': latest['product_services'], 'pct': latest['product_services'] / total_revenue * 100},
-        'Hardware': {'value': latest['product_hardware'], 'pct': latest['product_hardware'] / total_revenue * 100}
-    }
-    
-    # Region breakdown
-    region_breakdown = {
-        'North America': {'value': latest['region_north_america'], 'pct': latest['region_north_america'] / total_revenue * 100},
-        'Europe': {'value': latest['region_europe'], 'pct': latest['region_europe'] / total_revenue * 100},
-        'Asia': {'value': latest['region_asia'], 'pct': latest['region_asia'] / total_revenue * 100},
-        'Other': {'value': latest['region_other'], 'pct': latest['region_other'] / total_revenue * 100}
-    }
-    
-    # Customer segment breakdown
-    customer_breakdown = {
-        'Enterprise': {'value': latest['customers_enterprise'], 'pct': latest['customers_enterprise'] / total_revenue * 100},
-        'SMB': {'value': latest['customers_smb'], 'pct': latest['customers_smb'] / total_revenue * 100},
-        'Consumer': {'value': latest['customers_consumer'], 'pct': latest['customers_consumer'] / total_revenue * 100}
-    }
-    
-    return {
-        'by_product': product_breakdown,
-        'by_region': region_breakdown,
-        'by_customer': customer_breakdown
-    }
+    return _breakdown_from_row(df.iloc[-1:][_BREAKDOWN_COLS].to_numpy(dtype=np.float64)[0])
 
 
-def get_health_indicators(df: pd.DataFrame) -> list:
+def _breakdown_from_row(row: np.ndarray) -> dict:
+    """Split a last-row _BREAKDOWN_COLS vector into per-segment values and shares."""
+    # Segment values follow revenue; scale them all by one reciprocal
+    values = row[1:]
+    pcts = (values * (100.0 / row[0])).tolist()
+    values = values.tolist()
+    
+    breakdown, start = {}, 0
+    for key, pairs in _BREAKDOWN_SEGMENTS:
+        breakdown[key] = {
+            label: {'value': values[i], 'pct': pcts[i]}
+            for i, (label, _) in enumerate(pairs, start)
+        }
+        start += len(pairs)
+    return breakdown
+
+
+def get_health_indicators(
+    df: pd.DataFrame,
+    liquidity: dict = None,
+    leverage: dict = None,
+    profitability: dict = None
+) -> pd.DataFrame:
     """
     Generate financial health indicators.
     
     Args:
         df: DataFrame with financial data
+        liquidity: Precomputed liquidity ratios (calculated from df if omitted)
+        leverage: Precomputed leverage ratios (calculated from df if omitted)
+        profitability: Precomputed profitability ratios (calculated from df if omitted)
         
     Returns:
-        List of health indicator dictionaries
+        DataFrame with one row per indicator and columns metric, value,
+        status, benchmark and description
     """
-    liquidity = calculate_liquidity_ratios(df)
-    leverage = calculate_leverage_ratios(df)
-    profitability = calculate_profitability_ratios(df)
-    
-    indicators = []
-    
-    # Current Ratio
-    cr = liquidity['current_ratio']
-    indicators.append({
-        'metric': 'Current Ratio',
-        'value': cr,
-        'status': 'Good' if cr >= 1.5 else ('Warning' if cr >= 1.0 else 'Critical'),
-        'benchmark': '≥ 1.5',
-        'description': 'Ability to pay short-term obligations'
-    })
-    
-    # Quick Ratio
-    qr = liquidity['quick_ratio']
-    indicators.append({
-        'metric': 'Quick Ratio',
-        'value': qr,
-        'status': 'Good' if qr >= 1.0 else ('Warning' if qr >= 0.7 else 'Critical'),
-        'benchmark': '≥ 1.0',
-        'description': 'Liquid assets coverage of current liabilities'
-    })
-    
-    # Debt to Equity
-    de = leverage['debt_to_equity']
-    indicators.append({
-        'metric': 'Debt to Equity',
-        'value': de,
-        'status': 'Good' if de <= 1.0 else ('Warning' if de <= 2.0 else 'Critical'),
-        'benchmark': '≤ 1.0',
-        'description': 'Financial leverage level'
-    })
-    
-    # Interest Coverage
-    ic = leverage['interest_coverage']
-    indicators.append({
-        'metric': 'Interest Coverage',
-        'value': ic,
-        'status': 'Good' if ic >= 3.0 else ('Warning' if ic >= 1.5 else 'Critical'),
-        'benchmark': '≥ 3.0',
-        'description': 'Ability to service debt'
+    ratios = {'liquidity': liquidity, 'leverage': leverage, 'profitability': profitability}
+    if None in ratios.values():
+        computed = _ratio_groups(_last_row_dict(df, RATIO_INPUTS))
+        ratios = {group: computed[group] if given is None else given for group, given in ratios.items()}
+    values = [ratios[group][key] for _, group, key, _, _, _ in _HEALTH_INDICATORS]
+    
+    # Count thresholds met against (good, warning): 2 -> Good, 1 -> Warning, 0 -> Critical
+    signed = _HEALTH_SIGN * np.array(values, dtype=np.float64)
+    met = (signed[:, None] >= _HEALTH_SIGN[:, None] * _HEALTH_THRESHOLDS).sum(axis=1)
+    statuses = _HEALTH_LABELS[2 - met].tolist()
+    
+    metrics, _, _, benchmarks, descriptions, suffixes = zip(*_HEALTH_INDICATORS)
+    
+    return pd.DataFrame({
+        'metric': metrics,
+        'value': pd.Series(
+            [f"{value}{suffix}" if suffix else value for value, suffix in zip(values, suffixes)],
+            dtype=object
+        ),
+        'status': statuses,
+        'benchmark': benchmarks,
+        'description': descriptions
     })
+
+
+def compute_executive_bundle(df: pd.DataFrame) -> dict:
+    """
+    Compute the KPIs, ratios and summary charts for a period in one call.
     
-    # Return on Equity
-    roe = profitability['roe']
-    indicators.append({
-        'metric': 'Return on Equity',
-        'value': f"{roe}%",
-        'status': 'Good' if roe >= 15 else ('Warning' if roe >= 10 else 'Critical'),
-        'benchmark': '≥ 15%',
-        'description': 'Shareholder return efficiency'
-    })
+    KPIs, ratio groups and health indicators share one compute_all_ratios
+    pass over the last rows; the chart series are narrowed to the columns
+    they plot.
     
-    # Net Margin
-    nm = profitability['net_margin']
-    indicators.append({
-        'metric': 'Net Profit Margin',
-        'value': f"{nm}%",
-        'status': 'Good' if nm >= 15 else ('Warning' if nm >= 10 else 'Critical'),
-        'benchmark': '≥ 15%',
-        'description': 'Bottom line profitability'
-    })
+    Args:
+        df: DataFrame with financial data
+        
+    Returns:
+        Dictionary with the compute_all_ratios groups ('kpis', 'liquidity',
+        'efficiency', 'leverage', 'profitability'), health indicators and
+        chart frames
+    """
+    ratios = compute_all_ratios(df)
+    trend_cols = [c for c in ['date', 'revenue', 'revenue_ma'] if c in df.columns]
     
-    return indicators
+    return {
+        **ratios,
+        'health_indicators': get_health_indicators(
+            df,
+            liquidity=ratios['liquidity'],
+            leverage=ratios['leverage'],
+            profitability=ratios['profitability']
+        ),
+        'revenue_trend': df[trend_cols],
+        'margin_trend': df[['date', 'gross_margin', 'operating_margin', 'net_margin']]
+    }
@@ -6,10 +6,77 @@ Contains functions for time series forecasting of financial metrics.
 import pandas as pd
 import numpy as np
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
-from statsmodels.tsa.seasonal import seasonal_decompose
+from functools import lru_cache
 import warnings
 warnings.filterwarnings('ignore')
 
+from src._compat import njit
+
+
+def _series_key(df: pd.DataFrame, metric: str) -> tuple:
+    """Encode a metric (as float64) and its dates as hashable bytes for the fit cache."""
+    values = df[metric].to_numpy(dtype=np.float64)
+    dates = df['date'].to_numpy(dtype='datetime64[ns]')
+    return values.tobytes(), dates.tobytes()
+
+
+@lru_cache(maxsize=32)
+def _future_ms_range(last_date: np.datetime64, periods: int) -> pd.DatetimeIndex:
+    """Month-start dates for the forecast horizon after the last observed date."""
+    return pd.date_range(
+        start=pd.Timestamp(last_date) + pd.DateOffset(months=1),
+        periods=periods,
+        freq='MS'
+    )
+
+
+@lru_cache(maxsize=64)
+def _fit_holt_winters(values: bytes, dates: bytes, seasonal: str, periods: int) -> dict:
+    """
+    Fit a damped additive-trend Holt-Winters model and forecast it.
+    
+    Results are memoized on the raw series bytes, so re-rendering the same
+    data skips the optimizer. Returned arrays are read-only float64.
+    """
+    series = pd.Series(
+        np.frombuffer(values, dtype=np.float64),
+        index=pd.DatetimeIndex(np.frombuffer(dates, dtype='datetime64[ns]'))
+    )
+    model = ExponentialSmoothing(
+        series,
+        seasonal_periods=12,
+        trend='add',
+        seasonal=seasonal,
+        damped_trend=True
+    ).fit(optimized=True)
+    
+    forecast = model.forecast(periods).to_numpy()
+    fitted = model.fittedvalues.to_numpy()
+    forecast.setflags(write=False)
+    fitted.setflags(write=False)
+    
+    return {
+        'forecast': forecast,
+        'fitted': fitted,
+        'resid_std': model.resid.std(),
+        'params': {k: model.params[k] for k in ('smoothing_level', 'smoothing_trend', 'smoothing_seasonal')}
+    }
+
+
+@njit(cache=True, error_model='numpy')
+def _error_metrics(actual, fitted):
+    """MAE, MAPE (in percent) and RMSE of fitted values in a single pass."""
+    n = actual.shape[0]
+    abs_sum = 0.0
+    pct_sum = 0.0
+    sq_sum = 0.0
+    for i in range(n):
+        diff = actual[i] - fitted[i]
+        abs_sum += abs(diff)
+        pct_sum += abs(diff / actual[i])
+        sq_sum += diff * diff
+    return abs_sum / n, pct_sum / n * 100, np.sqrt(sq_sum / n)
+
 
 def forecast_revenue(df: pd.DataFrame, periods: int = 6) -> dict:
     """
@@ -22,46 +89,28 @@ def forecast_revenue(df: pd.DataFrame, periods: int = 6) -> dict:
     Returns:
         Dictionary with forecast data and metrics
     """
-    # Prepare data
-    revenue_series = df.set_index('date')['revenue']
-    
     try:
         # Fit Holt-Winters model with multiplicative seasonality
-        model = ExponentialSmoothing(
-            revenue_series,
-            seasonal_periods=12,
-            trend='add',
-            seasonal='mul',
-            damped_trend=True
-        ).fit(optimized=True)
-        
-        # Generate forecast
-        forecast = model.forecast(periods)
+        fit = _fit_holt_winters(*_series_key(df, 'revenue'), 'mul', periods)
+        forecast = fit['forecast']
         
         # Calculate confidence intervals (approximate)
-        residuals = model.resid
-        std_error = residuals.std()
+        std_error = fit['resid_std']
         
-        forecast_dates = pd.date_range(
-            start=df['date'].max() + pd.DateOffset(months=1),
-            periods=periods,
-            freq='MS'
-        )
+        forecast_dates = _future_ms_range(df['date'].to_numpy()[-1], periods)
         
         forecast_df = pd.DataFrame({
             'date': forecast_dates,
-            'forecast': forecast.values,
-            'lower_bound': forecast.values - 1.96 * std_error,
-            'upper_bound': forecast.values + 1.96 * std_error
+            'forecast': forecast,
+            'lower_bound': forecast - 1.96 * std_error,
+            'upper_bound': forecast + 1.96 * std_error
         })
         
         # Calculate accuracy metrics on training data
-        fitted_values = model.fittedvalues
-        actual = revenue_series[fitted_values.index]
+        fitted_values = fit['fitted']
+        actual = df['revenue'].to_numpy(dtype=np.float64)
         
-        mae = np.mean(np.abs(actual - fitted_values))
-        mape = np.mean(np.abs((actual - fitted_values) / actual)) * 100
-        rmse = np.sqrt(np.mean((actual - fitted_values) ** 2))
+        mae, mape, rmse = _error_metrics(actual, fitted_values)
         
         return {
             'forecast_df': forecast_df,
@@ -70,9 +119,9 @@ def forecast_revenue(df: pd.DataFrame, periods: int = 6) -> dict:
             'mape': round(mape, 2),
             'rmse': round(rmse, 2),
             'model_params': {
-                'alpha': round(model.params['smoothing_level'], 4),
-                'beta': round(model.params['smoothing_trend'], 4),
-                'gamma': round(model.params['smoothing_seasonal'], 4)
+                'alpha': round(fit['params']['smoothing_level'], 4),
+                'beta': round(fit['params']['smoothing_trend'], 4),
+                'gamma': round(fit['params']['smoothing_seasonal'], 4)
             }
         }
     except Exception as e:
@@ -92,28 +141,14 @@ def forecast_metric(df: pd.DataFrame, metric: str, periods: int = 6) -> dict:
     Returns:
         Dictionary with forecast data
     """
-    series = df.set_index('date')[metric]
-    
     try:
-        model = ExponentialSmoothing(
-            series,
-            seasonal_periods=12,
-            trend='add',
-            seasonal='add',
-            damped_trend=True
-        ).fit(optimized=True)
-        
-        forecast = model.forecast(periods)
+        forecast = _fit_holt_winters(*_series_key(df, metric), 'add', periods)['forecast']
         
-        forecast_dates = pd.date_range(
-            start=df['date'].max() + pd.DateOffset(months=1),
-            periods=periods,
-            freq='MS'
-        )
+        forecast_dates = _future_ms_range(df['date'].to_numpy()[-1], periods)
         
         forecast_df = pd.DataFrame({
             'date': forecast_dates,
-            'forecast': forecast.values
+            'forecast': forecast
         })
         
         return {
@@ -141,21 +176,18 @@ def simple_forecast(df: pd.DataFrame, metric: str, periods: int = 6) -> dict:
     
     # Calculate growth rate
     growth_rate = series.pct_change().mean()
-    last_value = series.iloc[-1]
+    last_value = series.to_numpy()[-1]
     
-    forecast_dates = pd.date_range(
-        start=df['date'].max() + pd.DateOffset(months=1),
-        periods=periods,
-        freq='MS'
-    )
+    forecast_dates = _future_ms_range(df['date'].to_numpy()[-1], periods)
     
-    forecast_values = [last_value * (1 + growth_rate) ** (i + 1) for i in range(periods)]
+    steps = np.arange(1, periods + 1, dtype=np.float64)
+    forecast_values = last_value * np.power(1.0 + growth_rate, steps)
     
     forecast_df = pd.DataFrame({
         'date': forecast_dates,
         'forecast': forecast_values,
-        'lower_bound': [v * 0.9 for v in forecast_values],
-        'upper_bound': [v * 1.1 for v in forecast_values]
+        'lower_bound': forecast_values * 0.9,
+        'upper_bound': forecast_values * 1.1
     })
     
     return {
@@ -168,10 +200,49 @@ def simple_forecast(df: pd.DataFrame, metric: str, periods: int = 6) -> dict:
     }
 
 
+@njit(cache=True)
+def _decompose_multiplicative(x, period):
+    """Centered moving-average trend, normalized seasonal index and residual of a series."""
+    n = x.shape[0]
+    half = period // 2
+    trend = np.full(n, np.nan)
+    
+    # Centered MA; an even period uses a 2 x period window with half-weight ends
+    for i in range(half, n - half):
+        if period % 2 == 0:
+            total = 0.5 * (x[i - half] + x[i + half])
+            for j in range(i - half + 1, i + half):
+                total += x[j]
+        else:
+            total = 0.0
+            for j in range(i - half, i + half + 1):
+                total += x[j]
+        trend[i] = total / period
+    
+    # Average the detrended ratio per position in the cycle
+    sums = np.zeros(period)
+    counts = np.zeros(period)
+    for i in range(half, n - half):
+        sums[i % period] += x[i] / trend[i]
+        counts[i % period] += 1
+    index = sums / counts
+    index /= index.mean()
+    
+    seasonal = np.empty(n)
+    for i in range(n):
+        seasonal[i] = index[i % period]
+    resid = x / seasonal / trend
+    
+    return trend, seasonal, resid
+
+
 def decompose_series(df: pd.DataFrame, metric: str = 'revenue') -> dict:
     """
     Decompose time series into trend, seasonal, and residual components.
     
+    Uses a classical multiplicative decomposition over a 12-month cycle,
+    matching statsmodels' seasonal_decompose without its pandas overhead.
+    
     Args:
         df: DataFrame with financial data
         metric: Column name to decompose
@@ -182,12 +253,15 @@ def decompose_series(df: pd.DataFrame, metric: str = 'revenue') -> dict:
     series = df.set_index('date')[metric]
     
     try:
-        decomposition = seasonal_decompose(series, model='multiplicative', period=12)
+        values = series.to_numpy(dtype=np.float64)
+        if len(values) < 24 or np.isnan(values).any() or (values <= 0).any():
+            raise ValueError("multiplicative decomposition needs two full positive cycles")
+        trend, seasonal, resid = _decompose_multiplicative(values, 12)
         
         return {
-            'trend': decomposition.trend,
-            'seasonal': decomposition.seasonal,
-            'residual': decomposition.resid,
+            'trend': pd.Series(trend, index=series.index, name='trend'),
+            'seasonal': pd.Series(seasonal, index=series.index, name='seasonal'),
+            'residual': pd.Series(resid, index=series.index, name='resid'),
             'original': series
         }
     except Exception:
@@ -209,22 +283,24 @@ def calculate_growth_projections(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with growth projections
     """
-    # Historical growth rates
-    df_annual = df.groupby('year')['revenue'].sum()
+    # Historical growth rates from per-year revenue totals (missing months skipped)
+    years, codes = np.unique(df['year'].to_numpy(), return_inverse=True)
+    revenue = df['revenue'].to_numpy(dtype=np.float64)
+    present = ~np.isnan(revenue)
+    annual = np.bincount(codes[present], weights=revenue[present], minlength=len(years))
     
-    if len(df_annual) >= 2:
-        yoy_growth = df_annual.pct_change().dropna()
-        avg_growth = yoy_growth.mean()
-        cagr = ((df_annual.iloc[-1] / df_annual.iloc[0]) ** (1 / (len(df_annual) - 1))) - 1
+    if len(annual) >= 2:
+        avg_growth = (np.diff(annual) / annual[:-1]).mean()
+        cagr = ((annual[-1] / annual[0]) ** (1 / (len(annual) - 1))) - 1
     else:
         avg_growth = 0
         cagr = 0
     
     # Monthly growth
-    monthly_growth = df['revenue'].pct_change().mean()
+    monthly_growth = np.nanmean(revenue[1:] / revenue[:-1] - 1) if len(revenue) > 1 else np.nan
     
-    # Project next year
-    last_year_revenue = df[df['year'] == df['year'].max()]['revenue'].sum()
+    # Project next year (no years means nothing to project from)
+    last_year_revenue = annual[-1].item() if len(annual) else 0.0
     
     projections = {
         'conservative': last_year_revenue * (1 + avg_growth * 0.5),
@@ -237,7 +313,7 @@ def calculate_growth_projections(df: pd.DataFrame) -> dict:
         'cagr': round(cagr * 100, 2),
         'monthly_growth': round(monthly_growth * 100, 2),
         'projections': projections,
-        'historical_annual': df_annual.to_dict()
+        'historical_annual': dict(zip(years.tolist(), annual.tolist()))
     }
 
 
@@ -259,21 +335,20 @@ def scenario_analysis(df: pd.DataFrame, scenarios: dict = None) -> pd.DataFrame:
             'optimistic': {'growth': 0.20, 'margin_change': 0.02}
         }
     
-    base_revenue = df['revenue'].iloc[-1] * 12  # Annualized
-    base_margin = df['net_margin'].iloc[-1] / 100
+    base_revenue = df['revenue'].to_numpy()[-1] * 12  # Annualized
+    base_margin = df['net_margin'].to_numpy()[-1] / 100
     
-    results = []
-    for scenario_name, params in scenarios.items():
-        projected_revenue = base_revenue * (1 + params['growth'])
-        projected_margin = base_margin + params['margin_change']
-        projected_net_income = projected_revenue * projected_margin
-        
-        results.append({
-            'scenario': scenario_name,
-            'revenue': projected_revenue,
-            'growth_rate': params['growth'] * 100,
-            'net_margin': projected_margin * 100,
-            'net_income': projected_net_income
-        })
+    names = list(scenarios)
+    growths = np.array([scenarios[n]['growth'] for n in names], dtype=np.float64)
+    margin_changes = np.array([scenarios[n]['margin_change'] for n in names], dtype=np.float64)
     
-    return pd.DataFrame(results)
+    projected_revenue = base_revenue * (1 + growths)
+    projected_margin = base_margin + margin_changes
+    
+    return pd.DataFrame({
+        'scenario': names,
+        'revenue': projected_revenue,
+        'growth_rate': growths * 100,
+        'net_margin': projected_margin * 100,
+        'net_income': projected_revenue * projected_margin
+    })
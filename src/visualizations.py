@@ -3,12 +3,26 @@ Visualizations Module
 Contains functions for creating interactive financial charts and graphs.
 """
 
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from hashlib import blake2b
+from threading import Lock
+
+from plotly.graph_objects import Bar, Figure, Indicator, Pie, Scatter, Scattergl, Table, Waterfall
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 
+from src._compat import njit
+
+# Serialize figures with orjson when available; Streamlit's plotly_chart goes
+# through plotly.io.to_json, so this covers every chart the dashboard renders.
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
 
 # Color scheme
 COLORS = {
@@ -25,12 +39,203 @@ COLORS = {
 
 CHART_COLORS = ['#1565C0', '#4CAF50', '#FF9800', '#9C27B0', '#00BCD4', '#F44336']
 
+# Health table status cell fills
+STATUS_COLORS = {
+    'Good': '#C8E6C9',
+    'Warning': '#FFF3E0',
+    'Critical': '#FFEBEE'
+}
+
+# Scenario bar colors (unknown scenarios fall back to the primary color)
+SCENARIO_COLORS = {
+    'pessimistic': COLORS['danger'],
+    'base': COLORS['primary'],
+    'optimistic': COLORS['success']
+}
 
-def create_kpi_card(value: float, title: str, delta: float = None, prefix: str = "$", suffix: str = "") -> go.Figure:
+# Columns consumed by create_income_statement_waterfall
+WATERFALL_COLS = ['revenue', 'cogs', 'operating_expenses', 'interest_expense', 'tax_expense', 'net_income']
+
+# Horizontal legend above the plot area, shared by the time-series and bar charts
+HORIZONTAL_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+
+# Invariant trace styling, shared across figures (Plotly copies these into each trace)
+_LINE_PRIMARY_3 = dict(color=COLORS['primary'], width=3)
+_LINE_PRIMARY_2 = dict(color=COLORS['primary'], width=2)
+_LINE_SECONDARY_2 = dict(color=COLORS['secondary'], width=2)
+_LINE_ACCENT_2 = dict(color=COLORS['accent'], width=2)
+_LINE_ACCENT_2_DASH = dict(color=COLORS['accent'], width=2, dash='dash')
+_LINE_HIDDEN = dict(color='rgba(255,255,255,0)')
+_MARKERS = {name: dict(color=color) for name, color in COLORS.items()}
+_WATERFALL_STYLE = dict(
+    connector={"line": {"color": "rgb(63, 63, 63)"}},
+    increasing={"marker": _MARKERS['success']},
+    decreasing={"marker": _MARKERS['danger']},
+    totals={"marker": _MARKERS['primary']}
+)
+_GAUGE_THRESHOLD_LINE = {'color': COLORS['dark'], 'width': 4}
+
+# Margin series drawn by create_profitability_chart: (column, name, line style)
+_MARGIN_SERIES = (
+    ('gross_margin', 'Gross Margin', _LINE_PRIMARY_2),
+    ('operating_margin', 'Operating Margin', _LINE_SECONDARY_2),
+    ('net_margin', 'Net Margin', _LINE_ACCENT_2)
+)
+
+# Palette indexed by _sign_index: on-target values first, shortfalls second
+SIGN_PALETTE = np.array([COLORS['success'], COLORS['danger']])
+
+# Upper bound on points shipped to the browser per time-series chart
+MAX_CHART_POINTS = 2000
+
+# Figures kept per chart builder by _memoize_figure
+FIGURE_CACHE_SIZE = 32
+
+
+def _content_digest(obj) -> bytes:
+    """Digest the per-row hashes of a pandas object, so row order is part of the key."""
+    row_hashes = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+    return blake2b(row_hashes.tobytes(), digest_size=16).digest()
+
+
+def _freeze(obj):
+    """Reduce chart inputs to a hashable key, hashing pandas and NumPy data by content."""
+    if isinstance(obj, pd.DataFrame):
+        return ('frame', tuple(obj.columns), tuple(map(str, obj.dtypes)), _content_digest(obj))
+    if isinstance(obj, pd.Series):
+        return ('series', obj.name, str(obj.dtype), _content_digest(obj))
+    if isinstance(obj, np.ndarray):
+        return ('array', obj.dtype.str, obj.shape, obj.tobytes())
+    if isinstance(obj, dict):
+        return tuple((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def _memoize_figure(func):
+    """
+    Return the previously built figure when a chart is requested with identical inputs.
+    
+    Cached figures are shared between callers, so they must not be mutated.
+    Inputs that cannot be reduced to a hashable key are built without caching.
+    """
+    cache = OrderedDict()
+    lock = Lock()
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (_freeze(args), _freeze(tuple(sorted(kwargs.items()))))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        
+        fig = func(*args, **kwargs)
+        with lock:
+            cache[key] = fig
+            if len(cache) > FIGURE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return fig
+    
+    return wrapper
+
+
+def _array(s: pd.Series) -> np.ndarray:
+    """Hand a column to Plotly as its backing array, with floats narrowed to float32."""
+    values = s.to_numpy()
+    if values.dtype.kind == 'f':
+        return np.ascontiguousarray(values, dtype=np.float32)
+    return values
+
+
+def _unvalidated_figure_kwargs() -> dict:
+    """Probe Plotly's private `_validate` keyword; fall back to validated figures without it."""
+    try:
+        if Figure(_validate=False)._validate is False:
+            return {'_validate': False}
+    except (TypeError, ValueError, AttributeError):
+        pass
+    return {}
+
+
+# Extra Figure arguments for _trusted_figure, resolved once for the installed Plotly
+_TRUSTED_FIGURE_KWARGS = _unvalidated_figure_kwargs()
+
+
+def _trusted_figure(data: list, layout: dict) -> Figure:
+    """Build a figure from plain trace and layout dicts, skipping schema validation where supported."""
+    return Figure(dict(data=data, layout=layout), **_TRUSTED_FIGURE_KWARGS)
+
+
+@njit(cache=True)
+def _sign_index(margins):
+    """Index SIGN_PALETTE per value: 0 where a margin is non-negative, 1 where negative or NaN."""
+    out = np.empty(margins.shape[0], dtype=np.int8)
+    for i in range(margins.shape[0]):
+        out[i] = 0 if margins[i] >= 0 else 1
+    return out
+
+
+@lru_cache(maxsize=64)
+def _forecast_title(metric: str) -> str:
+    """Chart title for a forecast of the given metric column."""
+    return f'{metric.replace("_", " ").title()} Forecast'
+
+
+def _band(upper: np.ndarray, lower: np.ndarray) -> np.ndarray:
+    """Outline of a filled band: upper edge forwards, then lower edge back, in one buffer."""
+    n = len(upper)
+    out = np.empty(2 * n, dtype=np.result_type(upper, lower))
+    out[:n] = upper
+    out[n:] = lower[::-1]
+    return out
+
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out representative positions with Largest-Triangle-Three-Buckets."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    bucket = (n - 2) / (n_out - 2)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        avg_x = (end + next_end - 1) / 2
+        avg_y = y[end:next_end].mean()
+        xs = np.arange(start, end)
+        area = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def _downsample(df: pd.DataFrame, y_col: str, max_points: int = MAX_CHART_POINTS) -> pd.DataFrame:
+    """Reduce a long frame to max_points rows, keeping the shape of y_col."""
+    if len(df) <= max_points:
+        return df
+    return df.iloc[_lttb_indices(df[y_col].to_numpy(), max_points)]
+
+
+@_memoize_figure
+def create_kpi_card(value: float, title: str, delta: float = None, prefix: str = "$", suffix: str = "") -> Figure:
     """Create a KPI indicator card."""
-    fig = go.Figure()
+    fig = Figure()
     
-    fig.add_trace(go.Indicator(
+    fig.add_trace(Indicator(
         mode="number+delta" if delta else "number",
         value=value,
         title={"text": title, "font": {"size": 14}},
@@ -47,114 +252,88 @@ def create_kpi_card(value: float, title: str, delta: float = None, prefix: str =
     return fig
 
 
-def create_revenue_trend_chart(df: pd.DataFrame) -> go.Figure:
+@_memoize_figure
+def create_revenue_trend_chart(df: pd.DataFrame) -> Figure:
     """Create revenue trend line chart with area fill."""
-    fig = go.Figure()
+    df = _downsample(df, 'revenue')
+    dates = _array(df['date'])
     
-    fig.add_trace(go.Scatter(
-        x=df['date'],
-        y=df['revenue'],
+    traces = [dict(
+        type='scattergl',
+        x=dates,
+        y=_array(df['revenue']),
         mode='lines',
         name='Revenue',
-        line=dict(color=COLORS['primary'], width=3),
+        line=_LINE_PRIMARY_3,
         fill='tozeroy',
         fillcolor='rgba(21, 101, 192, 0.1)'
-    ))
+    )]
     
     # Add moving average
     if 'revenue_ma' in df.columns:
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['revenue_ma'],
+        traces.append(dict(
+            type='scattergl',
+            x=dates,
+            y=_array(df['revenue_ma']),
             mode='lines',
             name='3-Month MA',
-            line=dict(color=COLORS['accent'], width=2, dash='dash')
+            line=_LINE_ACCENT_2_DASH
         ))
     
-    fig.update_layout(
-        title='Revenue Trend',
-        xaxis_title='Date',
-        yaxis_title='Revenue ($)',
+    return _trusted_figure(traces, dict(
+        title=dict(text='Revenue Trend'),
+        xaxis=dict(title=dict(text='Date')),
+        yaxis=dict(title=dict(text='Revenue ($)'), tickformat='$,.0f'),
         height=350,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=HORIZONTAL_LEGEND,
         hovermode='x unified'
-    )
-
-    fig.update_yaxes(tickformat='$,.0f')
-    
-    return fig
+    ))
 
 
-def create_profitability_chart(df: pd.DataFrame) -> go.Figure:
+@_memoize_figure
+def create_profitability_chart(df: pd.DataFrame) -> Figure:
     """Create profitability margins chart."""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=df['date'],
-        y=df['gross_margin'],
-        mode='lines+markers',
-        name='Gross Margin',
-        line=dict(color=COLORS['primary'], width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=df['date'],
-        y=df['operating_margin'],
-        mode='lines+markers',
-        name='Operating Margin',
-        line=dict(color=COLORS['secondary'], width=2)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=df['date'],
-        y=df['net_margin'],
-        mode='lines+markers',
-        name='Net Margin',
-        line=dict(color=COLORS['accent'], width=2)
-    ))
+    df = _downsample(df, 'gross_margin')
+    dates = _array(df['date'])
+    
+    traces = [
+        dict(
+            type='scattergl',
+            x=dates,
+            y=_array(df[col]),
+            mode='lines+markers',
+            name=name,
+            line=line
+        )
+        for col, name, line in _MARGIN_SERIES
+    ]
     
-    fig.update_layout(
-        title='Profitability Margins Trend',
-        xaxis_title='Date',
-        yaxis_title='Margin (%)',
+    return _trusted_figure(traces, dict(
+        title=dict(text='Profitability Margins Trend'),
+        xaxis=dict(title=dict(text='Date')),
+        yaxis=dict(title=dict(text='Margin (%)'), ticksuffix='%', hoverformat='.2f'),
         height=350,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=HORIZONTAL_LEGEND,
         hovermode='x unified'
-    )
-
-    fig.update_yaxes(ticksuffix='%')
-    
-    return fig
+    ))
 
 
-def create_income_statement_waterfall(row: pd.Series) -> go.Figure:
-    """Create income statement waterfall chart."""
-    fig = go.Figure(go.Waterfall(
+@_memoize_figure
+def create_income_statement_waterfall(row: dict) -> Figure:
+    """Create income statement waterfall chart from a mapping of WATERFALL_COLS values."""
+    # Expenses are shown as deductions between the revenue and net income totals
+    deducted = (False, True, True, True, True, False)
+    values = [row[c] for c in WATERFALL_COLS]
+    
+    fig = Figure(Waterfall(
         name="Income Statement",
         orientation="v",
         measure=["absolute", "relative", "relative", "relative", "relative", "total"],
         x=["Revenue", "COGS", "Operating Exp", "Interest", "Taxes", "Net Income"],
-        y=[
-            row['revenue'],
-            -row['cogs'],
-            -row['operating_expenses'],
-            -row['interest_expense'],
-            -row['tax_expense'],
-            row['net_income']
-        ],
+        y=[-v if minus else v for v, minus in zip(values, deducted)],
         textposition="outside",
-        text=[
-            f"${row['revenue']:,.0f}",
-            f"-${row['cogs']:,.0f}",
-            f"-${row['operating_expenses']:,.0f}",
-            f"-${row['interest_expense']:,.0f}",
-            f"-${row['tax_expense']:,.0f}",
-            f"${row['net_income']:,.0f}"
-        ],
-        connector={"line": {"color": "rgb(63, 63, 63)"}},
-        increasing={"marker": {"color": COLORS['success']}},
-        decreasing={"marker": {"color": COLORS['danger']}},
-        totals={"marker": {"color": COLORS['primary']}}
+        text=[f"{'-' if minus else ''}${v:,.0f}" for v, minus in zip(values, deducted)],
+        **_WATERFALL_STYLE
     ))
     
     fig.update_layout(
@@ -166,14 +345,15 @@ def create_income_statement_waterfall(row: pd.Series) -> go.Figure:
     return fig
 
 
-def create_revenue_breakdown_pie(breakdown: dict, breakdown_type: str = 'by_product') -> go.Figure:
+@_memoize_figure
+def create_revenue_breakdown_pie(breakdown: dict, breakdown_type: str = 'by_product') -> Figure:
     """Create revenue breakdown pie chart."""
     data = breakdown[breakdown_type]
     
-    labels = list(data.keys())
-    values = [data[k]['value'] for k in labels]
+    labels = list(data)
+    values = [segment['value'] for segment in data.values()]
     
-    fig = go.Figure(data=[go.Pie(
+    fig = Figure(data=[Pie(
         labels=labels,
         values=values,
         hole=0.4,
@@ -198,139 +378,175 @@ def create_revenue_breakdown_pie(breakdown: dict, breakdown_type: str = 'by_prod
     return fig
 
 
-def create_budget_variance_chart(merged_df: pd.DataFrame) -> go.Figure:
+@_memoize_figure
+def create_revenue_breakdown_subplots(breakdown: dict) -> Figure:
+    """Create product, region and customer revenue pies as one figure."""
+    from plotly.subplots import make_subplots
+    
+    panels = [
+        ('by_product', 'By Product'),
+        ('by_region', 'By Region'),
+        ('by_customer', 'By Customer Segment')
+    ]
+    
+    fig = make_subplots(
+        rows=1, cols=len(panels),
+        specs=[[{'type': 'domain'}] * len(panels)],
+        subplot_titles=[title for _, title in panels]
+    )
+    
+    # Each pie keeps its own horizontal legend, centered under its panel
+    legends = {}
+    for i, (breakdown_type, title) in enumerate(panels, 1):
+        data = breakdown[breakdown_type]
+        labels = list(data)
+        legend = 'legend' if i == 1 else f'legend{i}'
+        legends[legend] = dict(
+            orientation="h", yanchor="top", y=-0.1, xanchor="center", x=(i - 0.5) / len(panels)
+        )
+        fig.add_trace(Pie(
+            labels=labels,
+            values=[segment['value'] for segment in data.values()],
+            name=title,
+            hole=0.4,
+            marker_colors=CHART_COLORS[:len(labels)],
+            textinfo='label+percent',
+            textposition='outside',
+            legend=legend
+        ), row=1, col=i)
+    
+    fig.update_layout(
+        height=430,
+        showlegend=True,
+        margin=dict(t=60, b=90),
+        **legends
+    )
+    
+    return fig
+
+
+@_memoize_figure
+def create_budget_variance_chart(merged_df: pd.DataFrame) -> Figure:
     """Create budget vs actual variance chart."""
+    from plotly.subplots import make_subplots
+    
     fig = make_subplots(
         rows=1, cols=2,
         subplot_titles=('Revenue: Actual vs Budget', 'Variance %'),
         specs=[[{"type": "bar"}, {"type": "bar"}]]
     )
     
-    # Actual vs Budget bars
-    fig.add_trace(
-        go.Bar(name='Actual', x=merged_df['date'], y=merged_df['revenue'],
-               marker_color=COLORS['primary']),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Bar(name='Budget', x=merged_df['date'], y=merged_df['budget_revenue'],
-               marker_color=COLORS['light'], opacity=0.7),
-        row=1, col=1
-    )
-    
-    # Variance bars
-    colors = [COLORS['success'] if v >= 0 else COLORS['danger'] for v in merged_df['revenue_variance_pct']]
-    fig.add_trace(
-        go.Bar(name='Variance %', x=merged_df['date'], y=merged_df['revenue_variance_pct'],
-               marker_color=colors, showlegend=False),
-        row=1, col=2
+    dates = _array(merged_df['date'])
+    variance_pct = merged_df['revenue_variance_pct'].to_numpy(dtype=np.float64)
+    colors = SIGN_PALETTE[_sign_index(variance_pct)].tolist()
+    
+    # Actual vs Budget bars on the left, variance bars on the right
+    fig.add_traces(
+        [
+            Bar(name='Actual', x=dates, y=_array(merged_df['revenue']),
+                   marker_color=COLORS['primary']),
+            Bar(name='Budget', x=dates, y=_array(merged_df['budget_revenue']),
+                   marker_color=COLORS['light'], opacity=0.7),
+            Bar(name='Variance %', x=dates, y=_array(merged_df['revenue_variance_pct']),
+                   marker_color=colors, showlegend=False)
+        ],
+        rows=[1, 1, 1], cols=[1, 1, 2]
     )
     
     fig.update_layout(
         height=350,
         barmode='group',
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        legend=HORIZONTAL_LEGEND
     )
     
     fig.update_yaxes(tickformat='$,.0f', row=1, col=1)
-    fig.update_yaxes(ticksuffix='%', row=1, col=2)
+    fig.update_yaxes(ticksuffix='%', hoverformat='.2f', row=1, col=2)
     
     return fig
 
 
-def create_cash_flow_chart(cash_flow_df: pd.DataFrame) -> go.Figure:
+@_memoize_figure
+def create_cash_flow_chart(cash_flow_df: pd.DataFrame) -> Figure:
     """Create cash flow stacked bar chart."""
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Operating',
-        x=cash_flow_df['date'],
-        y=cash_flow_df['operating_cash_flow'],
-        marker_color=COLORS['success']
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Investing',
-        x=cash_flow_df['date'],
-        y=cash_flow_df['investing_cash_flow'],
-        marker_color=COLORS['danger']
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Financing',
-        x=cash_flow_df['date'],
-        y=cash_flow_df['financing_cash_flow'],
-        marker_color=COLORS['warning']
-    ))
-    
-    # Add net cash flow line
-    fig.add_trace(go.Scatter(
-        name='Net Cash Flow',
-        x=cash_flow_df['date'],
-        y=cash_flow_df['net_cash_flow'],
-        mode='lines+markers',
-        line=dict(color=COLORS['primary'], width=3)
-    ))
+    dates = _array(cash_flow_df['date'])
+    
+    traces = [
+        dict(type='bar', name='Operating', x=dates,
+             y=_array(cash_flow_df['operating_cash_flow']), marker=_MARKERS['success']),
+        dict(type='bar', name='Investing', x=dates,
+             y=_array(cash_flow_df['investing_cash_flow']), marker=_MARKERS['danger']),
+        dict(type='bar', name='Financing', x=dates,
+             y=_array(cash_flow_df['financing_cash_flow']), marker=_MARKERS['warning']),
+        
+        # Net cash flow line
+        dict(
+            type='scattergl',
+            name='Net Cash Flow',
+            x=dates,
+            y=_array(cash_flow_df['net_cash_flow']),
+            mode='lines+markers',
+            line=_LINE_PRIMARY_3
+        )
+    ]
     
-    fig.update_layout(
-        title='Cash Flow Analysis',
-        xaxis_title='Date',
-        yaxis_title='Cash Flow ($)',
+    return _trusted_figure(traces, dict(
+        title=dict(text='Cash Flow Analysis'),
+        xaxis=dict(title=dict(text='Date')),
+        yaxis=dict(title=dict(text='Cash Flow ($)'), tickformat='$,.0f'),
         height=400,
         barmode='relative',
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=HORIZONTAL_LEGEND,
         hovermode='x unified'
-    )
-
-    fig.update_yaxes(tickformat='$,.0f')
-    
-    return fig
+    ))
 
 
-def create_forecast_chart(forecast_result: dict) -> go.Figure:
+@_memoize_figure
+def create_forecast_chart(forecast_result: dict) -> Figure:
     """Create forecast chart with confidence intervals."""
     historical = forecast_result['historical']
     forecast_df = forecast_result['forecast_df']
     
-    fig = go.Figure()
+    fig = Figure()
     
     # Historical data
-    metric_col = historical.columns[1]  # Second column is the metric
-    fig.add_trace(go.Scatter(
-        x=historical['date'],
-        y=historical[metric_col],
+    metric_col = historical.columns.values[1]  # Second column is the metric
+    historical = _downsample(historical, metric_col)
+    fig.add_trace(Scattergl(
+        x=_array(historical['date']),
+        y=_array(historical[metric_col]),
         mode='lines',
         name='Historical',
-        line=dict(color=COLORS['primary'], width=2)
+        line=_LINE_PRIMARY_2
     ))
     
     # Forecast
-    fig.add_trace(go.Scatter(
-        x=forecast_df['date'],
-        y=forecast_df['forecast'],
+    fig.add_trace(Scattergl(
+        x=_array(forecast_df['date']),
+        y=_array(forecast_df['forecast']),
         mode='lines+markers',
         name='Forecast',
-        line=dict(color=COLORS['accent'], width=2, dash='dash')
+        line=_LINE_ACCENT_2_DASH
     ))
     
     # Confidence interval
     if 'lower_bound' in forecast_df.columns:
-        fig.add_trace(go.Scatter(
-            x=pd.concat([forecast_df['date'], forecast_df['date'][::-1]]),
-            y=pd.concat([forecast_df['upper_bound'], forecast_df['lower_bound'][::-1]]),
+        dates = _array(forecast_df['date'])
+        fig.add_trace(Scattergl(
+            x=_band(dates, dates),
+            y=_band(_array(forecast_df['upper_bound']), _array(forecast_df['lower_bound'])),
             fill='toself',
             fillcolor='rgba(255, 152, 0, 0.2)',
-            line=dict(color='rgba(255,255,255,0)'),
+            line=_LINE_HIDDEN,
             name='95% Confidence',
             showlegend=True
         ))
     
     fig.update_layout(
-        title=f'{metric_col.replace("_", " ").title()} Forecast',
+        title=_forecast_title(metric_col),
         xaxis_title='Date',
         yaxis_title='Value ($)',
         height=400,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=HORIZONTAL_LEGEND,
         hovermode='x unified'
     )
 
@@ -339,8 +555,11 @@ def create_forecast_chart(forecast_result: dict) -> go.Figure:
     return fig
 
 
-def create_financial_ratios_gauge(ratios: dict, ratio_type: str = 'liquidity') -> go.Figure:
+@_memoize_figure
+def create_financial_ratios_gauge(ratios: dict, ratio_type: str = 'liquidity') -> Figure:
     """Create gauge charts for financial ratios."""
+    from plotly.subplots import make_subplots
+    
     if ratio_type == 'liquidity':
         specs = [
             {'title': 'Current Ratio', 'value': ratios['current_ratio'], 'range': [0, 3], 'threshold': 1.5},
@@ -361,25 +580,26 @@ def create_financial_ratios_gauge(ratios: dict, ratio_type: str = 'liquidity') -
         subplot_titles=[s['title'] for s in specs]
     )
     
-    for i, spec in enumerate(specs, 1):
+    # Distance past each threshold in the good direction (reverse gauges prefer low values)
+    margins = np.array([
+        spec['threshold'] - spec['value'] if spec.get('reverse', False) else spec['value'] - spec['threshold']
+        for spec in specs
+    ], dtype=np.float64)
+    colors = SIGN_PALETTE[_sign_index(margins)].tolist()
+    
+    for i, (spec, color) in enumerate(zip(specs, colors), 1):
         threshold = spec['threshold']
         value = spec['value']
-        reverse = spec.get('reverse', False)
-        
-        if reverse:
-            color = COLORS['success'] if value <= threshold else COLORS['danger']
-        else:
-            color = COLORS['success'] if value >= threshold else COLORS['danger']
         
         fig.add_trace(
-            go.Indicator(
+            Indicator(
                 mode="gauge+number",
                 value=value,
                 gauge={
                     'axis': {'range': spec['range']},
                     'bar': {'color': color},
                     'threshold': {
-                        'line': {'color': COLORS['dark'], 'width': 4},
+                        'line': _GAUGE_THRESHOLD_LINE,
                         'thickness': 0.75,
                         'value': threshold
                     }
@@ -393,22 +613,25 @@ def create_financial_ratios_gauge(ratios: dict, ratio_type: str = 'liquidity') -
     return fig
 
 
-def create_quarterly_comparison_chart(quarterly_df: pd.DataFrame) -> go.Figure:
+@_memoize_figure
+def create_quarterly_comparison_chart(quarterly_df: pd.DataFrame) -> Figure:
     """Create quarterly comparison bar chart."""
-    fig = go.Figure()
+    quarterly_df = _downsample(quarterly_df, 'revenue')
+    
+    fig = Figure()
     
-    fig.add_trace(go.Bar(
+    fig.add_trace(Bar(
         name='Revenue',
-        x=quarterly_df['period'],
-        y=quarterly_df['revenue'],
+        x=_array(quarterly_df['period']),
+        y=_array(quarterly_df['revenue']),
         marker_color=COLORS['primary'],
         yaxis='y'
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(Scatter(
         name='Net Margin %',
-        x=quarterly_df['period'],
-        y=quarterly_df['net_margin'],
+        x=_array(quarterly_df['period']),
+        y=_array(quarterly_df['net_margin']),
         mode='lines+markers',
         marker_color=COLORS['accent'],
         yaxis='y2'
@@ -420,24 +643,23 @@ def create_quarterly_comparison_chart(quarterly_df: pd.DataFrame) -> go.Figure:
         yaxis=dict(title='Revenue ($)', tickformat='$,.0f'),
         yaxis2=dict(title='Net Margin (%)', overlaying='y', side='right', ticksuffix='%'),
         height=350,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=HORIZONTAL_LEGEND,
         hovermode='x unified'
     )
     
     return fig
 
 
-def create_health_indicator_table(indicators: list) -> go.Figure:
+@_memoize_figure
+def create_health_indicator_table(indicators_df: pd.DataFrame) -> Figure:
     """Create financial health indicator table."""
-    colors = {
-        'Good': '#C8E6C9',
-        'Warning': '#FFF3E0',
-        'Critical': '#FFEBEE'
-    }
+    fields = ['metric', 'value', 'status', 'benchmark', 'description']
+    columns = [indicators_df[f].tolist() for f in fields]
     
-    cell_colors = [[colors.get(ind['status'], '#FFFFFF') for ind in indicators]]
+    white = ['white'] * len(indicators_df)
+    status_colors = indicators_df['status'].map(STATUS_COLORS).fillna('#FFFFFF').tolist()
     
-    fig = go.Figure(data=[go.Table(
+    fig = Figure(data=[Table(
         header=dict(
             values=['Metric', 'Value', 'Status', 'Benchmark', 'Description'],
             fill_color=COLORS['primary'],
@@ -445,20 +667,8 @@ def create_health_indicator_table(indicators: list) -> go.Figure:
             align='left'
         ),
         cells=dict(
-            values=[
-                [ind['metric'] for ind in indicators],
-                [ind['value'] for ind in indicators],
-                [ind['status'] for ind in indicators],
-                [ind['benchmark'] for ind in indicators],
-                [ind['description'] for ind in indicators]
-            ],
-            fill_color=[
-                ['white'] * len(indicators),
-                ['white'] * len(indicators),
-                [colors.get(ind['status'], '#FFFFFF') for ind in indicators],
-                ['white'] * len(indicators),
-                ['white'] * len(indicators)
-            ],
+            values=columns,
+            fill_color=[white, white, status_colors, white, white],
             align='left',
             font=dict(size=11)
         )
@@ -469,23 +679,24 @@ def create_health_indicator_table(indicators: list) -> go.Figure:
     return fig
 
 
-def create_scenario_chart(scenario_df: pd.DataFrame) -> go.Figure:
+@_memoize_figure
+def create_scenario_chart(scenario_df: pd.DataFrame) -> Figure:
     """Create scenario analysis chart."""
-    colors = {
-        'pessimistic': COLORS['danger'],
-        'base': COLORS['primary'],
-        'optimistic': COLORS['success']
-    }
+    fig = Figure()
     
-    fig = go.Figure()
+    scenarios = scenario_df['scenario'].tolist()
+    revenues = scenario_df['revenue'].tolist()
+    net_incomes = scenario_df['net_income'].tolist()
+    texts = [[f"${r:,.0f}", f"${n:,.0f}"] for r, n in zip(revenues, net_incomes)]
+    color_for, default_color = SCENARIO_COLORS.get, COLORS['primary']
     
-    for _, row in scenario_df.iterrows():
-        fig.add_trace(go.Bar(
-            name=row['scenario'].title(),
+    for scenario, revenue, net_income, text in zip(scenarios, revenues, net_incomes, texts):
+        fig.add_trace(Bar(
+            name=scenario.title(),
             x=['Revenue', 'Net Income'],
-            y=[row['revenue'], row['net_income']],
-            marker_color=colors.get(row['scenario'], COLORS['primary']),
-            text=[f"${row['revenue']:,.0f}", f"${row['net_income']:,.0f}"],
+            y=[revenue, net_income],
+            marker_color=color_for(scenario, default_color),
+            text=text,
             textposition='outside'
         ))
     
@@ -495,7 +706,7 @@ def create_scenario_chart(scenario_df: pd.DataFrame) -> go.Figure:
         yaxis_title='Amount ($)',
         height=400,
         barmode='group',
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        legend=HORIZONTAL_LEGEND
     )
 
     fig.update_yaxes(tickformat='$,.0f')
@@ -0,0 +1,41 @@
+"""
+Tests for the grouped summaries in the financial analyzer.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import load_financial_data
+from src.financial_analyzer import calculate_annual_summary, calculate_quarterly_summary
+
+DATA_FILE = Path(__file__).resolve().parent.parent / "data" / "financial_data.csv"
+
+SUM_COLS = ['revenue', 'gross_profit', 'operating_income', 'net_income', 'ebitda']
+
+
+def _with_missing_revenue() -> pd.DataFrame:
+    df = load_financial_data(str(DATA_FILE))
+    df.loc[df.index[3], 'revenue'] = np.nan
+    return df
+
+
+def test_annual_summary_skips_missing_values_like_groupby_sum():
+    df = _with_missing_revenue()
+    expected = df.groupby('year')[SUM_COLS].sum()
+
+    annual = calculate_annual_summary(df).set_index('year')
+
+    assert not annual['revenue'].isna().any()
+    np.testing.assert_allclose(annual[SUM_COLS].to_numpy(), expected.to_numpy())
+
+
+def test_quarterly_summary_skips_missing_values_like_groupby_sum():
+    df = _with_missing_revenue()
+    expected = df.groupby(['year', 'quarter'])[SUM_COLS].sum()
+
+    quarterly = calculate_quarterly_summary(df).set_index(['year', 'quarter'])
+
+    assert not quarterly['revenue'].isna().any()
+    np.testing.assert_allclose(quarterly[SUM_COLS].to_numpy(), expected.to_numpy())